@@ -1,93 +1,89 @@
 import random
-from dataclasses import dataclass, field
-from enum import Enum
-from typing import Any, List, Optional
+from array import array
+from typing import List, Optional
 
+# Cards are plain ints 0-51: suit * 13 + (rank - 1), so a deck fits in 52 bytes.
+Card = int
 
-class Suit(Enum):
-    """Enumeration of card suits."""
+SUIT_GLYPHS = ("♥", "♦", "♣", "♠")  # Suit codes 0-3
 
-    HEARTS = "♥"
-    DIAMONDS = "♦"
-    CLUBS = "♣"
-    SPADES = "♠"
+DECK52 = array("B", range(52))
 
+# Evaluation codes (Cactus Kev style): a suit bit OR'd with a rank prime.
+# ANDing five codes detects a flush and multiplying their rank primes yields a
+# key that identifies the rank set regardless of order.
+RANK_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)  # Deuce through Ace
+SUIT_BITS = (256, 512, 1024, 2048)  # Same order as SUIT_GLYPHS
+RANK_MASK = 0x00FF
+SUIT_MASK = 0x0F00
+CARD_CODES = tuple(SUIT_BITS[c // 13] | RANK_PRIMES[(c - 1) % 13] for c in range(52))
+CARD_PRIMES = tuple(code & RANK_MASK for code in CARD_CODES)  # Rank prime per card
 
-class Card:
-    """Represents a playing card with rank and suit."""
+_DISPLAY_RANKS = {1: "A", 11: "J", 12: "Q", 13: "K"}
 
-    def __init__(self, rank: int, suit: Suit):
-        """
-        Initialize a card.
 
-        Args:
-            rank: Card rank (1=Ace, 2-10, 11=Jack, 12=Queen, 13=King)
-            suit: Card suit
-        """
-        if not 1 <= rank <= 13:
-            raise ValueError("Rank must be between 1 and 13")
-        self.rank = rank
-        self.suit = suit
-
-    @property
-    def value(self) -> int:
-        """Get the numeric value of the card for comparison."""
-        return self.rank
-
-    @property
-    def display_rank(self) -> str:
-        """Get the display string for the card rank."""
-        if self.rank == 1:
-            return "A"
-        elif self.rank == 11:
-            return "J"
-        elif self.rank == 12:
-            return "Q"
-        elif self.rank == 13:
-            return "K"
-        else:
-            return str(self.rank)
+def card_rank(card: Card) -> int:
+    """Get the rank of a card (1=Ace, 2-10, 11=Jack, 12=Queen, 13=King)."""
+    return card % 13 + 1
 
-    def __str__(self) -> str:
-        """String representation of the card."""
-        return f"{self.display_rank}{self.suit.value}"
 
-    def __repr__(self) -> str:
-        """Detailed string representation of the card."""
-        return f"Card(rank={self.rank}, suit={self.suit})"
+def card_suit(card: Card) -> int:
+    """Get the suit code of a card (0=Hearts, 1=Diamonds, 2=Clubs, 3=Spades)."""
+    return card // 13
 
-    def __eq__(self, other: Any) -> bool:
-        """Check if two cards are equal."""
-        if not isinstance(other, Card):
-            return False
-        return self.rank == other.rank and self.suit == other.suit
 
-    def __hash__(self) -> int:
-        """Hash function for the card."""
-        return hash((self.rank, self.suit))
+def _format_card(card: Card) -> str:
+    rank = card_rank(card)
+    return f"{_DISPLAY_RANKS.get(rank, rank)}{SUIT_GLYPHS[card_suit(card)]}"
+
+
+# Built once so every card_to_str call returns the same string object
+_CARD_STRS = tuple(_format_card(card) for card in range(52))
+
+
+def card_to_str(card: Card) -> str:
+    """String representation of a card, e.g. "A♠" or "10♥"."""
+    return _CARD_STRS[card]
 
 
-@dataclass
 class Deck:
     """A deck of 52 playing cards for Ultimate Texas Hold'em."""
 
-    cards: List[Card] = field(default_factory=list)
+    __slots__ = ("cards", "_top", "_rng")
 
-    def __post_init__(self):
-        """Initialize the deck with 52 cards if not provided."""
-        if not self.cards:
-            self.reset()
+    def __init__(self, seed: Optional[int] = None) -> None:
+        """
+        Initialize the deck with all 52 cards.
+
+        Args:
+            seed: Seed for the shuffle generator, or None to seed from the OS
+        """
+        # The backing store is allocated once; dealing only moves _top down.
+        self.cards = array("B", DECK52)
+        self._top = 52
+        self._rng = random.Random(seed)  # Seeded from the OS when seed is None
 
     def reset(self) -> None:
         """Reset the deck to contain all 52 standard playing cards."""
-        self.cards = []
-        for suit in Suit:
-            for rank in range(1, 14):  # 1 (Ace) through 13 (King)
-                self.cards.append(Card(rank, suit))
+        self.cards[:] = DECK52
+        self._top = 52
 
     def shuffle(self) -> None:
-        """Shuffle the deck using Fisher-Yates algorithm."""
-        random.shuffle(self.cards)
+        """Shuffle the remaining cards using Fisher-Yates algorithm."""
+        # random.shuffle swaps list items much faster than array items, so the
+        # remaining cards are shuffled as a list and written back
+        cards = self.cards[: self._top].tolist()
+        self._rng.shuffle(cards)
+        self.cards[: self._top] = array("B", cards)
+
+    def spawn_seed(self) -> int:
+        """
+        Draw a seed for another deck from this deck's shuffle generator.
+
+        Returns:
+            A 64-bit seed, reproducible whenever this deck was seeded
+        """
+        return self._rng.getrandbits(64)
 
     def deal_card(self) -> Optional[Card]:
         """
@@ -96,9 +92,10 @@ class Deck:
         Returns:
             The top card, or None if deck is empty
         """
-        if not self.cards:
+        if self._top == 0:
             return None
-        return self.cards.pop()
+        self._top -= 1
+        return self.cards[self._top]
 
     def deal_cards(self, count: int) -> List[Card]:
         """
@@ -113,26 +110,23 @@ class Deck:
         Raises:
             ValueError: If trying to deal more cards than available
         """
-        if count > len(self.cards):
-            raise ValueError(
-                f"Cannot deal {count} cards, only {len(self.cards)} available"
-            )
-
-        dealt_cards: List[Card] = []
-        for _ in range(count):
-            card = self.deal_card()
-            if card is not None:
-                dealt_cards.append(card)
-
+        start = self._top - max(count, 0)
+        if start < 0:
+            raise ValueError(f"Cannot deal {count} cards, only {self._top} available")
+
+        # Cards come off the top (end) of the deck, so the slice is reversed
+        dealt_cards = self.cards[start : self._top].tolist()
+        dealt_cards.reverse()
+        self._top = start
         return dealt_cards
 
     def cards_remaining(self) -> int:
         """Get the number of cards remaining in the deck."""
-        return len(self.cards)
+        return self._top
 
     def is_empty(self) -> bool:
         """Check if the deck is empty."""
-        return len(self.cards) == 0
+        return self._top == 0
 
     def peek_top(self) -> Optional[Card]:
         """
@@ -141,9 +135,9 @@ class Deck:
         Returns:
             The top card, or None if deck is empty
         """
-        if not self.cards:
+        if self._top == 0:
             return None
-        return self.cards[-1]
+        return self.cards[self._top - 1]
 
     def __str__(self) -> str:
         """String representation of the deck."""
@@ -151,7 +145,8 @@ class Deck:
 
     def __repr__(self) -> str:
         """Detailed string representation of the deck."""
-        return f"Deck(cards={self.cards})"
+        cards = ", ".join(card_to_str(card) for card in self.cards[: self._top])
+        return f"Deck(cards=[{cards}])"
 
 
 # Example usage and testing
@@ -169,14 +164,15 @@ if __name__ == "__main__":
     print("\nDealing 5 cards:")
     dealt = deck.deal_cards(5)
     for i, card in enumerate(dealt, 1):
-        print(f"Card {i}: {card}")
+        print(f"Card {i}: {card_to_str(card)}")
 
     print(f"\nAfter dealing: {deck}")
     print(f"Cards remaining: {deck.cards_remaining()}")
 
     # Peek at the top card
     top_card = deck.peek_top()
-    print(f"Top card (without dealing): {top_card}")
+    if top_card is not None:
+        print(f"Top card (without dealing): {card_to_str(top_card)}")
 
     # Reset the deck
     deck.reset()
@@ -1,17 +1,26 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
-from deck import Card, Deck
-from players import Action, Dealer, Player, Street
+from deck import Card, Deck, card_rank, card_to_str
+from players import PREFLOP_BET, STREET_MULTIPLIERS, Action, Dealer, Player, Street
 from rules import (
     HandCategory,
     compare_hands,
-    evaluate_best_hand,
+    evaluate_with_board,
     hand_category_to_string,
+    precompute_board,
+    settle_bets,
 )
+from sim import run_hands
 
+# Hands per run_hands call in quiet games; fixed so that seeded results do not
+# depend on the number of workers
+_PARALLEL_CHUNK_HANDS = 1000
 
-@dataclass
+
+@dataclass(slots=True)
 class GameState:
     """Represents the current state of the game visible to players."""
 
@@ -21,39 +30,65 @@ class GameState:
     pot_size: int = 0
     players_info: List[Dict[str, Any]] = field(default_factory=list)
     game_phase: str = "betting"  # "betting", "showdown", "finished"
+    # Hands added with show_hand, revealed only in the owner's view
+    private_hands: Dict[int, List[str]] = field(default_factory=dict)
+    # One reusable info dict per seat, kept across hands
+    _seats: Dict[int, Dict[str, Any]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    def reset(self) -> None:
+        """Clear the state for a new hand, keeping its containers."""
+        self.community_cards.clear()
+        self.current_street = Street.PRE_FLOP
+        self.pot_size = 0
+        self.players_info.clear()
+        self.game_phase = "betting"
+        self.private_hands.clear()
 
     def add_player_info(self, player: Player, show_hand: bool = False) -> None:
         """
-        Add player information to the game state.
+        Add or refresh player information in the game state.
 
         Args:
             player: Player to add info for
             show_hand: Whether to show the player's hand (for their own view)
         """
-        player_info: Dict[str, Any] = {
-            "position": player.position,
-            "money": player.money,
-            "ante": player.ante,
-            "blind": player.blind,
-            "bet": player.bet,
-            "total_investment": player.get_total_investment(),
-            "is_active": player.is_active,
-            "has_bet_this_hand": player.has_bet_this_hand,
-            "bet_street": player.bet_street.value if player.bet_street else None,
-            "hand": [],
-        }
-
         if show_hand:
-            player_info["hand"] = [str(card) for card in player.hand]
+            self.private_hands[player.position] = [
+                card_to_str(card) for card in player.hand
+            ]
         else:
-            player_info["hand"] = ["??", "??"]  # Hidden cards
-
-        self.players_info.append(player_info)
+            self.private_hands.pop(player.position, None)
+
+        player_info = self._seats.get(player.position)
+        if player_info is None:
+            player_info = self._seats[player.position] = {}
+        # Check the list itself, since callers may clear players_info directly
+        if all(listed is not player_info for listed in self.players_info):
+            self.players_info.append(player_info)
+
+        player_info["position"] = player.position
+        player_info["money"] = player.money
+        player_info["ante"] = player.ante
+        player_info["blind"] = player.blind
+        player_info["bet"] = player.bet
+        player_info["total_investment"] = player.get_total_investment()
+        player_info["is_active"] = player.is_active
+        player_info["has_bet_this_hand"] = player.has_bet_this_hand
+        player_info["bet_street"] = (
+            player.bet_street.value if player.bet_street else None
+        )
+        player_info["hand"] = ["??", "??"]  # Hidden from everyone else
 
     def get_player_view(self, player_position: int) -> Dict[str, Any]:
         """
         Get the game state from a specific player's perspective.
 
+        Other players' entries are shared with the game state rather than
+        copied, so the view is read-only and only current until the state
+        is next updated.
+
         Args:
             player_position: Position of the player requesting the view
 
@@ -61,58 +96,106 @@ class GameState:
             Game state with player's hand revealed
         """
         view: Dict[str, Any] = {
-            "community_cards": [str(card) for card in self.community_cards],
+            "community_cards": [card_to_str(card) for card in self.community_cards],
             "current_street": self.current_street.value,
             "pot_size": self.pot_size,
             "game_phase": self.game_phase,
         }
-        players_list: List[Dict[str, Any]] = []
-
-        for player_info in self.players_info:
-            if player_info["position"] == player_position:
-                # Show this player's hand
-                player_info_copy = player_info.copy()
-                player_info_copy["hand"] = [str(card) for card in player_info["hand"]]
-                players_list.append(player_info_copy)
-            else:
-                # Hide other players' hands
-                player_info_copy = player_info.copy()
-                player_info_copy["hand"] = ["??", "??"]
-                players_list.append(player_info_copy)
 
-        view["players"] = players_list
+        # Only the viewer's own hand is ever overlaid; other players' shared
+        # entries always keep their hands hidden
+        own_hand = self.private_hands.get(player_position)
+        view["players"] = [
+            (
+                {**player_info, "hand": own_hand}
+                if own_hand is not None and player_info["position"] == player_position
+                else player_info
+            )
+            for player_info in self.players_info
+        ]
 
         return view
 
 
+@dataclass
+class Results:
+    """Summary of a batch of hands played without console output."""
+
+    hands_played: int = 0
+    net: List[int] = field(default_factory=list)  # Money won or lost per seat
+
+    def __str__(self) -> str:
+        """String representation of the results."""
+        lines = [f"Hands played: {self.hands_played:,}"]
+        for position, delta in enumerate(self.net, 1):
+            lines.append(f"Player {position}: {delta:+,}")
+        return "\n".join(lines)
+
+
 class Game:
     """Main game engine for Ultimate Texas Hold'em."""
 
-    def __init__(self, num_players: int = 6, iterations: int = 1):
+    def __init__(
+        self,
+        num_players: int = 6,
+        iterations: int = 1,
+        verbose: bool = True,
+        seed: Optional[int] = None,
+        workers: Optional[int] = None,
+    ):
         """
         Initialize a new game.
 
         Args:
             num_players: Number of players (1-6)
             iterations: Number of hands to play
+            verbose: Whether to print the progress of each hand
+            seed: Seed for the deck shuffle, or None for a random one
+            workers: Processes used when not verbose (defaults to CPU count)
         """
         if not 1 <= num_players <= 6:
             raise ValueError("Number of players must be between 1 and 6")
 
         self.num_players = num_players
         self.iterations = iterations
-        self.deck = Deck()
+        self.verbose = verbose
+        self.workers = workers or os.cpu_count() or 1
+        self.deck = Deck(seed)
         self.dealer = Dealer()
         self.players: List[Player] = []
         self.current_iteration = 0
         self.game_state = GameState()
+        self._pool: Optional[ProcessPoolExecutor] = None
 
         # Initialize players
         for i in range(1, num_players + 1):
             self.players.append(Player(position=i))
 
+    def __enter__(self) -> "Game":
+        """Use the game as a context manager that closes its worker pool."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Shut down the worker pool on leaving the context."""
+        self.close()
+
     def start_game(self) -> None:
-        """Start the game and play all iterations."""
+        """
+        Start the game and play all iterations.
+
+        Quiet games (verbose=False) are played by sim.run_hands in worker
+        processes, which stay up for later calls; use the game as a context
+        manager or call close() to shut them down. run_hands plays the
+        built-in simple AI strategy, so overrides of ask_player_decision or
+        simple_ai_decision only take effect in verbose games and
+        simulate_batch.
+        """
+        if not self.verbose:
+            # Hands are independent, so quiet runs are spread over processes
+            self.play_parallel(self.iterations)
+            self.current_iteration = self.iterations
+            return
+
         print(f"=== Starting Ultimate Texas Hold'em ===")
         print(f"Players: {self.num_players}, Iterations: {self.iterations}")
 
@@ -129,15 +212,88 @@ class Game:
 
         self.show_final_results()
 
+    def simulate_batch(self, n_hands: int) -> Results:
+        """
+        Play a batch of hands with console output switched off.
+
+        Args:
+            n_hands: Number of hands to play
+
+        Returns:
+            Hands played and each player's net win or loss over the batch
+        """
+        starting_money = [player.money for player in self.players]
+        verbose = self.verbose
+        self.verbose = False
+        try:
+            for _ in range(n_hands):
+                self.play_hand()
+        finally:
+            self.verbose = verbose
+
+        return Results(
+            hands_played=n_hands,
+            net=[p.money - m for p, m in zip(self.players, starting_money)],
+        )
+
+    def play_parallel(self, n_hands: int) -> None:
+        """
+        Play hands with the flat simulation kernel and apply the net results.
+
+        Hands are split into fixed-size chunks that run in worker processes.
+        Each chunk plays from the players' current bankrolls, so chunks are
+        only used when no bankroll can run out during the hands; otherwise
+        all hands are played in order from this game's deck. Chunk decks are
+        seeded from this game's deck, so a seeded game repeats its results
+        regardless of the number of workers.
+
+        Args:
+            n_hands: Number of hands to play
+        """
+        bankrolls = [player.money for player in self.players]
+        # Ante, blind and the largest play bet, the most a seat can lose a hand
+        max_loss = n_hands * (1 + 1 + STREET_MULTIPLIERS[Street.PRE_FLOP])
+        if n_hands <= _PARALLEL_CHUNK_HANDS or min(bankrolls) < max_loss:
+            nets = [run_hands(n_hands, bankrolls, deck=self.deck)]
+        else:
+            chunks, extra = divmod(n_hands, _PARALLEL_CHUNK_HANDS)
+            sizes = [_PARALLEL_CHUNK_HANDS] * chunks + ([extra] if extra else [])
+            seeds = [self.deck.spawn_seed() for _ in sizes]
+            if self.workers <= 1:
+                nets = [
+                    run_hands(size, bankrolls, seed=seed)
+                    for size, seed in zip(sizes, seeds)
+                ]
+            else:
+                # Reuse the pool between calls; process startup is expensive
+                if self._pool is None:
+                    self._pool = ProcessPoolExecutor(max_workers=self.workers)
+                futures = [
+                    self._pool.submit(run_hands, size, bankrolls, seed=seed)
+                    for size, seed in zip(sizes, seeds)
+                ]
+                nets = [future.result() for future in futures]
+
+        for net in nets:
+            for player, delta in zip(self.players, net):
+                player.money += delta
+
+    def close(self) -> None:
+        """Shut down the worker pool, if one was started."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
     def play_hand(self) -> None:
         """Play a single hand of Ultimate Texas Hold'em."""
-        print(f"\n--- Starting New Hand ---")
+        if self.verbose:
+            print(f"\n--- Starting New Hand ---")
 
         # Reset for new hand
         self.deck.reset()
         self.deck.shuffle()
         self.dealer.reset()
-        self.game_state = GameState()
+        self.game_state.reset()
 
         # Reset all players
         for player in self.players:
@@ -161,48 +317,48 @@ class Game:
 
     def place_initial_bets(self) -> None:
         """Place ante and blind bets for all players."""
-        print(f"\n--- Placing Initial Bets ---")
+        if self.verbose:
+            print(f"\n--- Placing Initial Bets ---")
 
         ante_amount = 1
         blind_amount = 1
 
         for player in self.players:
-            if player.place_ante(ante_amount):
-                print(f"{player} placed ${ante_amount} ante")
+            if player.post_stakes(ante_amount, blind_amount):
+                self.game_state.pot_size += ante_amount + blind_amount
+                if self.verbose:
+                    print(
+                        f"{player} placed ${ante_amount} ante and ${blind_amount} blind"
+                    )
             else:
-                print(f"{player} cannot afford ante, folding")
-                player.fold()
-
-            if player.is_active and player.place_blind(blind_amount):
-                print(f"{player} placed ${blind_amount} blind")
-            elif player.is_active:
-                print(f"{player} cannot afford blind, folding")
+                if self.verbose:
+                    print(f"{player} cannot afford ante and blind, folding")
                 player.fold()
 
-        # Update pot
-        self.update_pot()
-
     def deal_initial_cards(self) -> None:
         """Deal initial hole cards to players and dealer."""
-        print(f"\n--- Dealing Initial Cards ---")
+        if self.verbose:
+            print(f"\n--- Dealing Initial Cards ---")
 
-        # Deal to players
-        for player in self.players:
-            if player.is_active:
-                card1 = self.deck.deal_card()
-                card2 = self.deck.deal_card()
-                if card1 and card2:
-                    player.receive_card(card1)
-                    player.receive_card(card2)
-                    print(f"{player} received: {card1}, {card2}")
-
-        # Deal to dealer
-        dealer_card1 = self.deck.deal_card()
-        dealer_card2 = self.deck.deal_card()
-        if dealer_card1 and dealer_card2:
-            self.dealer.receive_card(dealer_card1)
-            self.dealer.receive_card(dealer_card2)
-            print(f"Dealer received: {dealer_card1}, {dealer_card2}")
+        # Deal two cards each to the active players and the dealer in one slice,
+        # in the same order as dealing them one at a time
+        active_players = [player for player in self.players if player.is_active]
+        cards = self.deck.deal_cards(2 * len(active_players) + 2)
+
+        for i, player in enumerate(active_players):
+            player.hand.extend(cards[2 * i : 2 * i + 2])
+            if self.verbose:
+                print(
+                    f"{player} received: "
+                    f"{card_to_str(cards[2 * i])}, {card_to_str(cards[2 * i + 1])}"
+                )
+
+        self.dealer.hand.extend(cards[-2:])
+        if self.verbose:
+            print(
+                f"Dealer received: "
+                f"{card_to_str(cards[-2])}, {card_to_str(cards[-1])}"
+            )
 
     def play_betting_rounds(self) -> None:
         """Play all betting rounds (pre-flop, flop, river)."""
@@ -210,18 +366,17 @@ class Game:
 
         for street in streets:
             self.game_state.current_street = street
-            print(f"\n--- {street.value.upper()} Betting Round ---")
+            if self.verbose:
+                print(f"\n--- {street.value.upper()} Betting Round ---")
 
             # Get decisions from all active players
             for player in self.players:
                 if player.is_active:
                     self.get_player_decision(player, street)
 
-            # Update pot
-            self.update_pot()
-
             # Show current state
-            self.show_current_state()
+            if self.verbose:
+                self.show_current_state()
 
     def get_player_decision(self, player: Player, street: Street) -> None:
         """
@@ -231,10 +386,9 @@ class Game:
             player: Player making the decision
             street: Current betting street
         """
-        # Create game state for this player
-        self.game_state.players_info.clear()
+        # Refresh the game state for this player
         for p in self.players:
-            self.game_state.add_player_info(p, show_hand=(p == player))
+            self.game_state.add_player_info(p, show_hand=p is player)
 
         # Get player's view of the game state
         player_view = self.game_state.get_player_view(player.position)
@@ -244,22 +398,26 @@ class Game:
 
         # Execute decision
         if decision == Action.BET:
-            if player.can_bet():
-                base_bet = 1  # Default base bet amount
-                if player.place_bet(base_bet, street):
-                    actual_bet = player.get_bet_amount_for_street(base_bet, street)
+            base_bet = 1  # Default base bet amount
+            actual_bet = player.place_bet(base_bet, street)
+            if actual_bet:
+                self.game_state.pot_size += actual_bet
+                if self.verbose:
                     print(f"{player} BET ${actual_bet} on {street.value}")
-                else:
-                    print(f"{player} cannot afford to bet, checking instead")
-                    player.check(street)
             else:
-                print(f"{player} already bet this hand, checking")
+                if self.verbose:
+                    if player.can_bet():
+                        print(f"{player} cannot afford to bet, checking instead")
+                    else:
+                        print(f"{player} already bet this hand, checking")
                 player.check(street)
         else:  # CHECK
             if player.check(street):
-                print(f"{player} CHECKED on {street.value}")
+                if self.verbose:
+                    print(f"{player} CHECKED on {street.value}")
             else:
-                print(f"{player} CHECKED on {street.value} (lost blind and ante)")
+                if self.verbose:
+                    print(f"{player} CHECKED on {street.value} (lost blind and ante)")
 
     def ask_player_decision(
         self, player: Player, game_state: Dict[str, Any], street: Street
@@ -293,164 +451,104 @@ class Game:
             AI's decision
         """
         # Simple strategy: bet on pre-flop with good cards, check otherwise
-        if street == Street.PRE_FLOP and player.can_bet():
-            # Bet if we have a pair or high cards
-            hand_value = player.get_hand_value()
-            if hand_value >= 20 or (player.hand[0].rank == player.hand[1].rank):
-                return Action.BET
+        if (
+            street == Street.PRE_FLOP
+            and player.can_bet()
+            and PREFLOP_BET[card_rank(player.hand[0])][card_rank(player.hand[1])]
+        ):
+            return Action.BET
 
         return Action.CHECK
 
     def deal_community_cards(self) -> None:
         """Deal all community cards (flop, turn, river)."""
-        print(f"\n--- Dealing Community Cards ---")
+        if self.verbose:
+            print(f"\n--- Dealing Community Cards ---")
 
         # Deal flop (3 cards)
         flop_cards = self.deck.deal_cards(3)
         for card in flop_cards:
             self.dealer.add_community_card(card)
             self.game_state.community_cards.append(card)
-        print(f"Flop: {', '.join(str(card) for card in flop_cards)}")
+        if self.verbose:
+            print(f"Flop: {', '.join(card_to_str(card) for card in flop_cards)}")
 
         # Deal turn (1 card)
         turn_card = self.deck.deal_card()
-        if turn_card:
+        if turn_card is not None:
             self.dealer.add_community_card(turn_card)
             self.game_state.community_cards.append(turn_card)
-            print(f"Turn: {turn_card}")
+            if self.verbose:
+                print(f"Turn: {card_to_str(turn_card)}")
 
         # Deal river (1 card)
         river_card = self.deck.deal_card()
-        if river_card:
+        if river_card is not None:
             self.dealer.add_community_card(river_card)
             self.game_state.community_cards.append(river_card)
-            print(f"River: {river_card}")
+            if self.verbose:
+                print(f"River: {card_to_str(river_card)}")
 
-        print(
-            f"All community cards: {', '.join(str(card) for card in self.game_state.community_cards)}"
-        )
+        if self.verbose:
+            print(
+                f"All community cards: {', '.join(card_to_str(card) for card in self.game_state.community_cards)}"
+            )
 
     def showdown(self) -> None:
         """Handle the showdown phase."""
-        print(f"\n--- Showdown ---")
-        print(
-            f"Dealer's hole cards: {', '.join(str(card) for card in self.dealer.hand)}"
-        )
-        print(
-            f"Community cards: {', '.join(str(card) for card in self.game_state.community_cards)}"
-        )
-
-        # Evaluate dealer best hand
-        dealer_best = evaluate_best_hand(
-            self.dealer.hand + self.game_state.community_cards
-        )
-        print(
-            f"Dealer best: {hand_category_to_string(dealer_best.category)} "
-            f"(tiebreakers: {dealer_best.tiebreakers})"
-        )
-
-        # Evaluate each active player and compare vs dealer
-        for player in self.players:
-            if not player.is_active:
-                continue
-
-            player_best = evaluate_best_hand(
-                player.hand + self.game_state.community_cards
+        if self.verbose:
+            print(f"\n--- Showdown ---")
+            print(
+                f"Dealer's hole cards: {', '.join(card_to_str(card) for card in self.dealer.hand)}"
             )
-            result = compare_hands(player_best, dealer_best)
-            outcome = "TIES"
-            if result > 0:
-                outcome = "BEATS"
-            elif result < 0:
-                outcome = "LOSES TO"
-
             print(
-                f"{player} - Best: {hand_category_to_string(player_best.category)} "
-                f"(tiebreakers: {player_best.tiebreakers}) {outcome} Dealer"
+                f"Community cards: {', '.join(card_to_str(card) for card in self.game_state.community_cards)}"
             )
 
-        # Resolve payouts
-        print("\n--- Payouts ---")
-        dealer_qualifies = dealer_best.category >= HandCategory.PAIR
-        for player in self.players:
-            if not player.is_active:
-                continue
+        # Decode the shared board once for the dealer and every player
+        board = precompute_board(self.game_state.community_cards)
 
-            player_best = evaluate_best_hand(
-                player.hand + self.game_state.community_cards
+        # Evaluate dealer best hand
+        dealer_best = evaluate_with_board(self.dealer.hand, board)
+        if self.verbose:
+            print(
+                f"Dealer best: {hand_category_to_string(dealer_best.category)} "
+                f"(tiebreakers: {dealer_best.tiebreakers})"
             )
-            result = compare_hands(player_best, dealer_best)
-
-            ante_stake = player.ante
-            blind_stake = player.blind
-            play_stake = player.bet
 
-            ante_return = 0
-            blind_return = 0
-            play_return = 0
+        # Evaluate each active player once, then compare and pay out
+        player_bests = [
+            evaluate_with_board(player.hand, board) if player.is_active else None
+            for player in self.players
+        ]
+        dealer_qualifies = dealer_best.category >= HandCategory.PAIR
+        for player, player_best in zip(self.players, player_bests):
+            if player_best is None:
+                continue
 
-            # Play (bet) pays even money; push on tie
-            if play_stake > 0:
-                if result > 0:
-                    play_return = play_stake * 2
-                elif result == 0:
-                    play_return = play_stake
-
-            # Ante pays 1:1 only if dealer qualifies; otherwise push regardless
-            if ante_stake > 0:
-                if dealer_qualifies:
-                    if result > 0:
-                        ante_return = ante_stake * 2
-                    elif result == 0:
-                        ante_return = ante_stake
-                else:
-                    ante_return = ante_stake
-
-            # Blind payout table; push if win with less than a Straight; push on tie; lose on dealer win
-            if blind_stake > 0:
+            if self.verbose:
+                result = compare_hands(player_best, dealer_best)
+                outcome = "TIES"
                 if result > 0:
-                    category = player_best.category
-                    if category >= HandCategory.STRAIGHT:
-                        # Determine payout and return stake + winnings
-                        if category == HandCategory.STRAIGHT:
-                            blind_return = blind_stake * 2  # 1:1
-                        elif category == HandCategory.FLUSH:
-                            # 3:2 payout → stake + 1.5x
-                            blind_return = blind_stake + (blind_stake * 3) // 2
-                        elif category == HandCategory.FULL_HOUSE:
-                            blind_return = blind_stake * 4  # 3:1
-                        elif category == HandCategory.FOUR_OF_A_KIND:
-                            blind_return = blind_stake * 11  # 10:1
-                        elif category == HandCategory.STRAIGHT_FLUSH:
-                            # Royal Flush check (Ace-high straight flush)
-                            high_card = (
-                                player_best.tiebreakers[0]
-                                if player_best.tiebreakers
-                                else 0
-                            )
-                            if high_card == 14:
-                                blind_return = blind_stake * 501  # 500:1
-                            else:
-                                blind_return = blind_stake * 51  # 50:1
-                    else:
-                        # Win with less than a straight → push
-                        blind_return = blind_stake
-                elif result == 0:
-                    blind_return = blind_stake
+                    outcome = "BEATS"
+                elif result < 0:
+                    outcome = "LOSES TO"
+                print(
+                    f"{player} - Best: {hand_category_to_string(player_best.category)} "
+                    f"(tiebreakers: {player_best.tiebreakers}) {outcome} Dealer"
+                )
 
+            ante_return, blind_return, play_return = settle_bets(
+                player_best, dealer_best, player.ante, player.blind, player.bet
+            )
             total_return = ante_return + blind_return + play_return
             player.money += total_return
 
-            print(
-                f"{player} returns - Ante: ${ante_return}, Blind: ${blind_return}, "
-                f"Play: ${play_return} (Dealer qualifies: {dealer_qualifies})"
-            )
-
-    def update_pot(self) -> None:
-        """Update the pot size based on all player bets."""
-        self.game_state.pot_size = sum(
-            player.get_total_investment() for player in self.players
-        )
+            if self.verbose:
+                print(
+                    f"{player} returns - Ante: ${ante_return}, Blind: ${blind_return}, "
+                    f"Play: ${play_return} (Dealer qualifies: {dealer_qualifies})"
+                )
 
     def show_current_state(self) -> None:
         """Show the current game state."""
@@ -464,7 +562,8 @@ class Game:
 
     def reset_for_new_hand(self) -> None:
         """Reset everything for a new hand."""
-        print(f"\n--- Resetting for New Hand ---")
+        if self.verbose:
+            print(f"\n--- Resetting for New Hand ---")
         # Players and dealer are already reset in play_hand()
         pass
 
@@ -486,3 +585,11 @@ if __name__ == "__main__":
     # Create and start a game
     game = Game(num_players=6, iterations=2)
     game.start_game()
+
+    # Simulate many hands quietly
+    print(f"\n{Game(num_players=6).simulate_batch(1_000)}")
+
+    # Spread a quiet run over worker processes, shutting them down afterwards
+    with Game(num_players=6, iterations=10_000, verbose=False) as quiet_game:
+        quiet_game.start_game()
+    print(f"\nAfter 10,000 quiet hands: {[p.money for p in quiet_game.players]}")
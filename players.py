@@ -1,8 +1,15 @@
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Optional
+from itertools import chain
+from typing import Iterator, List, Optional
 
-from deck import Card
+from deck import Card, card_rank, card_to_str
+
+# Pre-flop bet decision of the simple AI, indexed by the two hole-card ranks
+# (1=Ace ... 13=King): bet any pair, or when the ranks add up to 20 or more
+PREFLOP_BET = tuple(
+    tuple(r1 == r2 or r1 + r2 >= 20 for r2 in range(14)) for r1 in range(14)
+)
 
 
 class Action(Enum):
@@ -20,7 +27,11 @@ class Street(Enum):
     RIVER = "river"
 
 
-@dataclass
+# Play bet multiple of the base bet on each street
+STREET_MULTIPLIERS = {Street.PRE_FLOP: 4, Street.FLOP: 2, Street.RIVER: 1}
+
+
+@dataclass(slots=True)
 class Player:
     """Represents a player in Ultimate Texas Hold'em."""
 
@@ -30,7 +41,6 @@ class Player:
     ante: int = 0
     blind: int = 0
     bet: int = 0
-    total_bet: int = 0
     is_active: bool = True
     has_folded: bool = False
     has_bet_this_hand: bool = False
@@ -41,6 +51,30 @@ class Player:
         if not 1 <= self.position <= 6:
             raise ValueError("Player position must be between 1 and 6")
 
+    @property
+    def total_bet(self) -> int:
+        """Total amount staked this hand (ante, blind and bet)."""
+        return self.ante + self.blind + self.bet
+
+    def post_stakes(self, ante: int, blind: int) -> bool:
+        """
+        Post the ante and blind for a new hand in one step.
+
+        Args:
+            ante: Amount to bet as ante
+            blind: Amount to bet as blind
+
+        Returns:
+            True if successful, False if the player cannot afford both
+        """
+        if ante + blind > self.money:
+            return False
+
+        self.money -= ante + blind
+        self.ante = ante
+        self.blind = blind
+        return True
+
     def place_ante(self, amount: int) -> bool:
         """
         Place an ante bet.
@@ -56,7 +90,6 @@ class Player:
 
         self.money -= amount
         self.ante = amount
-        self.total_bet += amount
         return True
 
     def place_blind(self, amount: int) -> bool:
@@ -74,10 +107,9 @@ class Player:
 
         self.money -= amount
         self.blind = amount
-        self.total_bet += amount
         return True
 
-    def place_bet(self, amount: int, street: Street) -> bool:
+    def place_bet(self, amount: int, street: Street) -> int:
         """
         Place a bet based on the current street.
 
@@ -86,24 +118,21 @@ class Player:
             street: Current betting street
 
         Returns:
-            True if successful, False if insufficient funds or already bet
+            The actual amount bet, or 0 if insufficient funds or already bet
         """
         if self.has_bet_this_hand:
-            return False  # Can only bet once per hand
+            return 0  # Can only bet once per hand
 
-        # Get street multiplier
-        multiplier = self._get_street_multiplier(street)
-        bet_amount = amount * multiplier
+        bet_amount = amount * STREET_MULTIPLIERS[street]
 
         if bet_amount > self.money:
-            return False
+            return 0
 
         self.money -= bet_amount
         self.bet = bet_amount
-        self.total_bet += bet_amount
         self.has_bet_this_hand = True
         self.bet_street = street
-        return True
+        return bet_amount
 
     def _get_street_multiplier(self, street: Street) -> int:
         """
@@ -115,12 +144,7 @@ class Player:
         Returns:
             Multiplier for the street (4x pre-flop, 2x flop, 1x river)
         """
-        if street == Street.PRE_FLOP:
-            return 4
-        elif street == Street.FLOP:
-            return 2
-        else:  # RIVER
-            return 1
+        return STREET_MULTIPLIERS[street]
 
     def check(self, street: Street) -> bool:
         """
@@ -158,10 +182,9 @@ class Player:
 
     def reset_bets(self) -> None:
         """Reset all bets for a new hand."""
-        self.ante = 1
-        self.blind = 1
-        self.bet = 1
-        self.total_bet = 0
+        self.ante = 0
+        self.blind = 0
+        self.bet = 0
         self.is_active = True
         self.has_folded = False
         self.has_bet_this_hand = False
@@ -175,7 +198,7 @@ class Player:
         Returns:
             Sum of card values in hand
         """
-        return sum(card.value for card in self.hand)
+        return sum(card_rank(card) for card in self.hand)
 
     def can_afford(self, amount: int) -> bool:
         """
@@ -196,7 +219,7 @@ class Player:
         Returns:
             Total of ante, blind, and bet
         """
-        return self.ante + self.blind + self.bet
+        return self.total_bet
 
     def can_bet(self) -> bool:
         """
@@ -218,22 +241,26 @@ class Player:
         Returns:
             Actual bet amount (base * street multiplier)
         """
-        return base_amount * self._get_street_multiplier(street)
+        return base_amount * STREET_MULTIPLIERS[street]
 
     def __str__(self) -> str:
         """String representation of the player."""
         return f"Player {self.position} (${self.money:,})"
 
     def __repr__(self) -> str:
-        """Detailed string representation of the player."""
+        """Short representation of the player; see describe() for the rest."""
+        return f"Player(position={self.position}, money={self.money})"
+
+    def describe(self) -> str:
+        """Detailed string representation of the player, including the hand."""
         return (
             f"Player(position={self.position}, money={self.money}, "
-            f"hand={self.hand}, ante={self.ante}, blind={self.blind}, "
+            f"hand={[card_to_str(c) for c in self.hand]}, ante={self.ante}, blind={self.blind}, "
             f"bet={self.bet}, is_active={self.is_active})"
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Dealer:
     """Represents the dealer in Ultimate Texas Hold'em."""
 
@@ -279,7 +306,7 @@ class Dealer:
         Returns:
             Sum of card values in dealer's hand
         """
-        return sum(card.value for card in self.hand)
+        return sum(card_rank(card) for card in self.hand)
 
     def get_all_cards(self) -> List[Card]:
         """
@@ -290,13 +317,32 @@ class Dealer:
         """
         return self.hand + self.community_cards
 
+    def iter_all_cards(self) -> Iterator[Card]:
+        """
+        Iterate over all cards available to the dealer without copying them.
+
+        Returns:
+            Iterator over the hand, then the community cards
+        """
+        return chain(self.hand, self.community_cards)
+
     def __str__(self) -> str:
         """String representation of the dealer."""
         return f"Dealer (hand: {len(self.hand)} cards, community: {len(self.community_cards)} cards)"
 
     def __repr__(self) -> str:
-        """Detailed string representation of the dealer."""
-        return f"Dealer(hand={self.hand}, community_cards={self.community_cards})"
+        """Short representation of the dealer; see describe() for the cards."""
+        return (
+            f"Dealer(hand={len(self.hand)} cards, "
+            f"community_cards={len(self.community_cards)} cards)"
+        )
+
+    def describe(self) -> str:
+        """Detailed string representation of the dealer, including the cards."""
+        return (
+            f"Dealer(hand={[card_to_str(c) for c in self.hand]}, "
+            f"community_cards={[card_to_str(c) for c in self.community_cards]})"
+        )
 
 
 # Example usage and testing
@@ -325,42 +371,45 @@ if __name__ == "__main__":
     for player in players:
         card1 = deck.deal_card()
         card2 = deck.deal_card()
-        if card1 and card2:
+        if card1 is not None and card2 is not None:
             player.receive_card(card1)
             player.receive_card(card2)
-            print(f"{player} received: {card1}, {card2}")
+            print(f"{player} received: {card_to_str(card1)}, {card_to_str(card2)}")
 
     # Deal dealer cards
     dealer_card1 = deck.deal_card()
     dealer_card2 = deck.deal_card()
-    if dealer_card1 and dealer_card2:
+    if dealer_card1 is not None and dealer_card2 is not None:
         dealer.receive_card(dealer_card1)
         dealer.receive_card(dealer_card2)
-        print(f"Dealer received: {dealer_card1}, {dealer_card2}")
+        print(
+            f"Dealer received: {card_to_str(dealer_card1)}, "
+            f"{card_to_str(dealer_card2)}"
+        )
 
     # Deal flop (3 cards)
     print("\n=== Dealing Flop ===")
     flop_cards = deck.deal_cards(3)
     for card in flop_cards:
         dealer.add_community_card(card)
-    print(f"Flop: {', '.join(str(card) for card in flop_cards)}")
+    print(f"Flop: {', '.join(card_to_str(card) for card in flop_cards)}")
 
     # Deal turn (1 card)
     print("\n=== Dealing Turn ===")
     turn_card = deck.deal_card()
-    if turn_card:
+    if turn_card is not None:
         dealer.add_community_card(turn_card)
-        print(f"Turn: {turn_card}")
+        print(f"Turn: {card_to_str(turn_card)}")
 
     # Deal river (1 card)
     print("\n=== Dealing River ===")
     river_card = deck.deal_card()
-    if river_card:
+    if river_card is not None:
         dealer.add_community_card(river_card)
-        print(f"River: {river_card}")
+        print(f"River: {card_to_str(river_card)}")
 
     print(
-        f"\nAll community cards: {', '.join(str(card) for card in dealer.community_cards)}"
+        f"\nAll community cards: {', '.join(card_to_str(card) for card in dealer.community_cards)}"
     )
 
     # Place initial bets
@@ -432,11 +481,15 @@ if __name__ == "__main__":
     # Show final states
     print("\n=== Final States ===")
     print(f"Dealer: {dealer}")
-    print(f"Dealer's hole cards: {', '.join(str(card) for card in dealer.hand)}")
-    print(f"Community cards: {', '.join(str(card) for card in dealer.community_cards)}")
+    print(
+        f"Dealer's hole cards: {', '.join(card_to_str(card) for card in dealer.hand)}"
+    )
+    print(
+        f"Community cards: {', '.join(card_to_str(card) for card in dealer.community_cards)}"
+    )
     for player in players:
         print(
-            f"{player} - Hand: {', '.join(str(card) for card in player.hand)} "
+            f"{player} - Hand: {', '.join(card_to_str(card) for card in player.hand)} "
             f"(value: {player.get_hand_value()}), "
             f"Total investment: ${player.get_total_investment()}"
         )
@@ -1,9 +1,12 @@
+from array import array
 from dataclasses import dataclass
 from enum import IntEnum
-from itertools import combinations
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from itertools import combinations, combinations_with_replacement
+from operator import itemgetter
+from typing import Dict, Iterable, List, NamedTuple, Sequence, Tuple
 
-from deck import Card
+from deck import CARD_CODES, CARD_PRIMES, RANK_PRIMES, SUIT_BITS, SUIT_MASK, Card
 
 
 class HandCategory(IntEnum):
@@ -20,148 +23,452 @@ class HandCategory(IntEnum):
     STRAIGHT_FLUSH = 8
 
 
-@dataclass(frozen=True)
-class EvaluatedHand:
+class EvaluatedHand(NamedTuple):
     """Represents an evaluated 5-card poker hand."""
 
     category: HandCategory
     tiebreakers: Tuple[int, ...]
-    cards: Tuple[Card, ...]
+    cards_mask: int  # Bit n set for card id n
 
-    def as_tuple(self) -> Tuple[int, Tuple[int, ...]]:
-        return int(self.category), self.tiebreakers
+    @property
+    def cards(self) -> Tuple[Card, ...]:
+        """The five cards of the hand, in card id order."""
+        return _mask_cards(self.cards_mask)
 
 
-def _rank_value(rank: int) -> int:
-    """Map card rank to comparable value. Ace (1) becomes 14 by default."""
-    return 14 if rank == 1 else rank
+def _cards_mask(cards: Iterable[Card]) -> int:
+    """Return the bitmask of the cards, bit n set for card id n."""
+    mask = 0
+    for card in cards:
+        mask |= 1 << card
+    return mask
 
 
-def _sorted_rank_values_desc(cards: List[Card]) -> List[int]:
-    return sorted([_rank_value(c.rank) for c in cards], reverse=True)
+def _mask_cards(mask: int) -> Tuple[Card, ...]:
+    """Return the cards of a bitmask, lowest card id first."""
+    cards = []
+    while mask:
+        low_bit = mask & -mask
+        cards.append(low_bit.bit_length() - 1)
+        mask ^= low_bit
+    return tuple(cards)
 
 
-def _straight_high_card(ranks: List[int]) -> Optional[int]:
+def _build_straight_table() -> Tuple[int, ...]:
     """
-    Given a list of 5 rank values (Ace mapped to 14), return the straight high card
-    or None if not a straight. Handles wheel (A-2-3-4-5) returning 5.
+    Map every 13-bit rank mask (bit 0 = deuce ... bit 12 = ace) to the high
+    card of the straight it forms, or 0 if it is not a straight.
     """
-    unique = sorted(set(ranks), reverse=True)
-    if len(unique) != 5:
-        return None
-
-    # Normal straight check (e.g., K-Q-J-10-9)
-    if all(unique[i] - 1 == unique[i + 1] for i in range(4)):
-        return unique[0]
-
-    # Wheel: A-2-3-4-5 → treat Ace as 1 (represented as 14 here)
-    if set(unique) == {14, 5, 4, 3, 2}:
-        return 5
-
-    return None
+    table = [0] * (1 << 13)
+    for high in range(6, 15):
+        table[0b11111 << (high - 6)] = high
+    table[0b1000000001111] = 5  # Wheel: A-2-3-4-5
+    return tuple(table)
 
 
-def _is_flush(cards: List[Card]) -> bool:
-    return len({c.suit for c in cards}) == 1
+_STRAIGHT_HIGH = _build_straight_table()
 
 
-def _rank_counts(cards: List[Card]) -> List[Tuple[int, int]]:
+def _rank_counts(ranks: Sequence[int]) -> List[Tuple[int, int]]:
     """
     Return list of (rank_value, count) sorted by count desc, then rank desc.
     """
-    counts: Dict[int, int] = {}
-    for c in cards:
-        rv = _rank_value(c.rank)
-        counts[rv] = counts.get(rv, 0) + 1
-    return sorted(counts.items(), key=lambda x: (x[1], x[0]), reverse=True)
-
-
-def evaluate_five_card_hand(cards: List[Card]) -> EvaluatedHand:
-    if len(cards) != 5:
-        raise ValueError("evaluate_five_card_hand requires exactly 5 cards")
+    counts = [0] * 15  # Indexed by rank value 2-14
+    for rv in ranks:
+        counts[rv] += 1
+    # Scanning from the Ace down leaves equal counts in rank order, which the
+    # stable sort by count keeps
+    pairs = [(rv, counts[rv]) for rv in range(14, 1, -1) if counts[rv]]
+    pairs.sort(key=itemgetter(1), reverse=True)
+    return pairs
+
+
+def _classify(
+    ranks_desc: Tuple[int, ...], flush: bool
+) -> Tuple[HandCategory, Tuple[int, ...]]:
+    """
+    Classify five rank values (sorted descending, Ace as 14).
 
-    ranks_desc = _sorted_rank_values_desc(cards)
-    flush = _is_flush(cards)
-    straight_high = _straight_high_card(ranks_desc)
-    rank_count_pairs = _rank_counts(cards)  # [(rank, count), ...] sorted
+    Returns:
+        The hand category and its tiebreakers
+    """
+    rank_mask = 0
+    for rv in ranks_desc:
+        rank_mask |= 1 << (rv - 2)
+    straight_high = _STRAIGHT_HIGH[rank_mask]  # 0 if not a straight
+    rank_count_pairs = _rank_counts(ranks_desc)  # [(rank, count), ...] sorted
 
     # Straight Flush
-    if flush and straight_high is not None:
-        return EvaluatedHand(
-            HandCategory.STRAIGHT_FLUSH, (straight_high,), tuple(cards)
-        )
+    if flush and straight_high:
+        return HandCategory.STRAIGHT_FLUSH, (straight_high,)
 
     # Four of a Kind
     if rank_count_pairs[0][1] == 4:
         quad_rank = rank_count_pairs[0][0]
         kicker = max(r for r, _ in rank_count_pairs if r != quad_rank)
-        return EvaluatedHand(
-            HandCategory.FOUR_OF_A_KIND, (quad_rank, kicker), tuple(cards)
-        )
+        return HandCategory.FOUR_OF_A_KIND, (quad_rank, kicker)
 
     # Full House
     if rank_count_pairs[0][1] == 3 and rank_count_pairs[1][1] == 2:
         trip_rank = rank_count_pairs[0][0]
         pair_rank = rank_count_pairs[1][0]
-        return EvaluatedHand(
-            HandCategory.FULL_HOUSE, (trip_rank, pair_rank), tuple(cards)
-        )
+        return HandCategory.FULL_HOUSE, (trip_rank, pair_rank)
 
     # Flush
     if flush:
-        return EvaluatedHand(HandCategory.FLUSH, tuple(ranks_desc), tuple(cards))
+        return HandCategory.FLUSH, ranks_desc
 
     # Straight
-    if straight_high is not None:
-        return EvaluatedHand(HandCategory.STRAIGHT, (straight_high,), tuple(cards))
+    if straight_high:
+        return HandCategory.STRAIGHT, (straight_high,)
 
     # Three of a Kind
     if rank_count_pairs[0][1] == 3:
         trip_rank = rank_count_pairs[0][0]
         kickers = [r for r, _ in rank_count_pairs if r != trip_rank]
         kickers_sorted = sorted(kickers, reverse=True)
-        return EvaluatedHand(
-            HandCategory.THREE_OF_A_KIND,
-            (trip_rank, *tuple(kickers_sorted)),
-            tuple(cards),
-        )
+        return HandCategory.THREE_OF_A_KIND, (trip_rank, *kickers_sorted)
 
     # Two Pair
     if rank_count_pairs[0][1] == 2 and rank_count_pairs[1][1] == 2:
         pair_high = max(rank_count_pairs[0][0], rank_count_pairs[1][0])
         pair_low = min(rank_count_pairs[0][0], rank_count_pairs[1][0])
         kicker = max(r for r, _ in rank_count_pairs if r not in (pair_high, pair_low))
-        return EvaluatedHand(
-            HandCategory.TWO_PAIR, (pair_high, pair_low, kicker), tuple(cards)
-        )
+        return HandCategory.TWO_PAIR, (pair_high, pair_low, kicker)
 
     # One Pair
     if rank_count_pairs[0][1] == 2:
         pair_rank = rank_count_pairs[0][0]
         kickers = [r for r, _ in rank_count_pairs if r != pair_rank]
         kickers_sorted = sorted(kickers, reverse=True)
-        return EvaluatedHand(
-            HandCategory.PAIR, (pair_rank, *tuple(kickers_sorted)), tuple(cards)
-        )
+        return HandCategory.PAIR, (pair_rank, *kickers_sorted)
 
     # High Card
-    return EvaluatedHand(HandCategory.HIGH_CARD, tuple(ranks_desc), tuple(cards))
+    return HandCategory.HIGH_CARD, ranks_desc
+
+
+# A hand's category and tiebreakers, which together fix its strength
+_HandClass = Tuple[HandCategory, Tuple[int, ...]]
+
+
+def _build_rank_tables() -> (
+    Tuple[Dict[int, int], Dict[int, int], Tuple[_HandClass, ...]]
+):
+    """
+    Rank every distinct 5-card hand class, 1 (royal flush) to 7462.
+
+    Hands are keyed by the product of their rank primes, which is the same
+    for any order of the cards. Flushes (five distinct ranks) get their own
+    table since the same ranks off-suit are a weaker hand.
+
+    Returns:
+        The flush and non-flush rank tables, and the category and
+        tiebreakers of each rank (index 0 unused)
+    """
+    flush_classes: Dict[int, _HandClass] = {}
+    unsuited_classes: Dict[int, _HandClass] = {}
+    for indices in combinations_with_replacement(range(13), 5):
+        if indices[0] == indices[4]:
+            continue  # Five of a kind needs more than one deck
+        product = 1
+        for i in indices:
+            product *= RANK_PRIMES[i]
+        ranks_desc = tuple(i + 2 for i in reversed(indices))  # Deuce is rank value 2
+        unsuited_classes[product] = _classify(ranks_desc, False)
+        if len(set(indices)) == 5:
+            flush_classes[product] = _classify(ranks_desc, True)
+
+    hand_classes = sorted(
+        set(flush_classes.values()) | set(unsuited_classes.values()), reverse=True
+    )
+    rank_of = {hand_class: rank for rank, hand_class in enumerate(hand_classes, 1)}
+    return (
+        {key: rank_of[hand_class] for key, hand_class in flush_classes.items()},
+        {key: rank_of[hand_class] for key, hand_class in unsuited_classes.items()},
+        (hand_classes[0], *hand_classes),  # Pad so ranks index directly
+    )
+
+
+_FLUSH_RANKS, _UNSUITED_RANKS, _HAND_CLASSES = _build_rank_tables()
+
+
+def five_card_rank(cards: Sequence[Card]) -> int:
+    """
+    Rank five cards from 1 (royal flush) to 7462 (seven-high); lower is better.
+
+    Args:
+        cards: Exactly five cards
+
+    Returns:
+        The hand rank
+    """
+    c0, c1, c2, c3, c4 = cards
+    product = (
+        CARD_PRIMES[c0]
+        * CARD_PRIMES[c1]
+        * CARD_PRIMES[c2]
+        * CARD_PRIMES[c3]
+        * CARD_PRIMES[c4]
+    )
+    if (
+        CARD_CODES[c0]
+        & CARD_CODES[c1]
+        & CARD_CODES[c2]
+        & CARD_CODES[c3]
+        & CARD_CODES[c4]
+        & SUIT_MASK
+    ):
+        return _FLUSH_RANKS[product]
+    return _UNSUITED_RANKS[product]
+
+
+def evaluate_five_card_hand(cards: Sequence[Card]) -> EvaluatedHand:
+    if len(cards) != 5:
+        raise ValueError("evaluate_five_card_hand requires exactly 5 cards")
+
+    category, tiebreakers = _HAND_CLASSES[five_card_rank(cards)]
+    return EvaluatedHand(category, tiebreakers, _cards_mask(cards))
+
+
+# The two cards left out of each 5-card hand drawn from seven, in the same
+# order as combinations(range(7), 5), with a bitmask of the two positions
+_SEVEN_CARD_DROPS = tuple(
+    (i, j, (1 << i) | (1 << j))
+    for keep in combinations(range(7), 5)
+    for i, j in [tuple(k for k in range(7) if k not in keep)]
+)
+
+
+def _flush_suit(codes: Sequence[int]) -> int:
+    """Return the suit bit shared by at least five of the codes, or 0."""
+    for suit_bit in SUIT_BITS:
+        if sum(1 for code in codes if code & suit_bit) >= 5:
+            return suit_bit
+    return 0
+
+
+@lru_cache(maxsize=1 << 16)  # Room for every 7-card rank multiset (49205)
+def _best_unsuited(product: int) -> Tuple[int, int]:
+    """
+    Best non-flush hand in seven cards, which depends only on their ranks.
 
+    Args:
+        product: Product of the seven rank primes
 
-def evaluate_best_hand(cards: List[Card]) -> EvaluatedHand:
+    Returns:
+        The best hand rank, and the prime product of the two cards it leaves out
+    """
+    primes = []
+    remaining = product
+    for prime in RANK_PRIMES:
+        while remaining % prime == 0:
+            primes.append(prime)
+            remaining //= prime
+
+    best = len(_HAND_CLASSES)
+    best_dropped = 1
+    for i, j, _ in _SEVEN_CARD_DROPS:
+        dropped = primes[i] * primes[j]
+        rank = _UNSUITED_RANKS[product // dropped]
+        if rank < best:
+            best = rank
+            best_dropped = dropped
+    return best, best_dropped
+
+
+def _best_of_seven(
+    cards: Sequence[Card],
+    primes: Sequence[int],
+    product: int,
+    mask: int,
+    flush_bit: int,
+) -> Tuple[int, int]:
+    """
+    Find the best of the 21 five-card hands in seven cards.
+
+    Each hand's rank key is the 7-card prime product divided by the primes of
+    the two cards left out, so no 5-card hand is built to look it up.
+
+    Args:
+        cards: Seven cards
+        primes: Rank prime of each card
+        product: Product of the seven rank primes
+        mask: Bitmask of the seven cards
+        flush_bit: Suit bit held by at least five of the cards, or 0
+
+    Returns:
+        The best hand rank and the bitmask of the five cards that make it
+    """
+    if not flush_bit:
+        # Without a flush only the ranks matter, so reuse the cached result
+        # and leave out the first two cards with the same ranks it left out
+        best, best_dropped = _best_unsuited(product)
+        for i, j, _ in _SEVEN_CARD_DROPS:
+            if primes[i] * primes[j] == best_dropped:
+                return best, mask ^ (1 << cards[i]) ^ (1 << cards[j])
+
+    # Positions of the cards outside the flush suit; a hand is a flush only
+    # when both cards it leaves out cover all of them
+    off_suit = 0
+    for k, card in enumerate(cards):
+        if not CARD_CODES[card] & flush_bit:
+            off_suit |= 1 << k
+
+    best = len(_HAND_CLASSES)
+    best_i, best_j = 5, 6
+    for i, j, dropped in _SEVEN_CARD_DROPS:
+        key = product // (primes[i] * primes[j])
+        if off_suit | dropped == dropped:
+            rank = _FLUSH_RANKS[key]
+        else:
+            rank = _UNSUITED_RANKS[key]
+        if rank < best:
+            best = rank
+            best_i, best_j = i, j
+    return best, mask ^ (1 << cards[best_i]) ^ (1 << cards[best_j])
+
+
+def _rank_seven(cards: Sequence[Card]) -> Tuple[int, int]:
+    """Decode seven cards and find their best hand rank and cards mask."""
+    primes = [CARD_PRIMES[card] for card in cards]
+    product = 1
+    for prime in primes:
+        product *= prime
+    return _best_of_seven(
+        cards,
+        primes,
+        product,
+        _cards_mask(cards),
+        _flush_suit([CARD_CODES[card] for card in cards]),
+    )
+
+
+def evaluate_best_7(cards: Sequence[Card]) -> int:
+    """
+    Rank the best 5-card hand in seven cards, 1 (royal flush) to 7462.
+
+    Args:
+        cards: Exactly seven cards
+
+    Returns:
+        The best hand rank; lower is better
+
+    Raises:
+        ValueError: If there are not exactly seven cards
+    """
+    if len(cards) != 7:
+        raise ValueError("evaluate_best_7 requires exactly 7 cards")
+    primes = [CARD_PRIMES[card] for card in cards]
+    product = 1
+    for prime in primes:
+        product *= prime
+    flush_bit = _flush_suit([CARD_CODES[card] for card in cards])
+    if not flush_bit:
+        return _best_unsuited(product)[0]  # Skip picking out the cards
+    return _best_of_seven(cards, primes, product, _cards_mask(cards), flush_bit)[0]
+
+
+def evaluate_hands_batch(hands: Iterable[Sequence[Card]]) -> array:
+    """
+    Rank the best 5-card hand of many seven-card hands, e.g. for Monte Carlo
+    odds, without building an EvaluatedHand for each.
+
+    Args:
+        hands: Seven cards per hand
+
+    Returns:
+        Unsigned 16-bit array of best hand ranks, one per hand, in order
+
+    Raises:
+        ValueError: If a hand does not have exactly seven cards
+    """
+    return array("H", map(evaluate_best_7, hands))
+
+
+def evaluate_best_hand(cards: Sequence[Card]) -> EvaluatedHand:
     """Evaluate the best 5-card hand from up to 7 cards."""
     if len(cards) < 5:
         raise ValueError("Need at least 5 cards to evaluate a hand")
-    best: Optional[EvaluatedHand] = None
-    for combo in combinations(cards, 5):
-        evaluated = evaluate_five_card_hand(list(combo))
-        if best is None or (evaluated.category, evaluated.tiebreakers) > (
-            best.category,
-            best.tiebreakers,
-        ):
-            best = evaluated
-    assert best is not None
-    return best
+    if len(cards) == 5:
+        return evaluate_five_card_hand(cards)  # Only one hand to choose from
+    if len(cards) == 7:
+        best_rank, best_mask = _rank_seven(cards)
+    else:
+        # Lower ranks are better; min keeps the first of equally good hands.
+        # combinations() beats indexing precomputed positions for so few hands;
+        # the seven-card kernel above uses its precomputed _SEVEN_CARD_DROPS
+        best_cards = min(combinations(cards, 5), key=five_card_rank)
+        best_rank = five_card_rank(best_cards)
+        best_mask = _cards_mask(best_cards)
+    category, tiebreakers = _HAND_CLASSES[best_rank]
+    return EvaluatedHand(category, tiebreakers, best_mask)
+
+
+@dataclass(frozen=True)
+class BoardState:
+    """Community-card work shared by every hand evaluated against a board."""
+
+    cards: Tuple[Card, ...]
+    primes: Tuple[int, ...]  # Rank prime of each card
+    product: int  # Product of the rank primes
+    mask: int  # Bitmask of the cards
+    flush_bit: int  # Suit bit of three or more cards, or 0 if no flush is possible
+    flush_count: int  # Number of cards in that suit
+
+
+def precompute_board(board: Sequence[Card]) -> BoardState:
+    """Decode the five community cards once for evaluate_with_board."""
+    if len(board) != 5:
+        raise ValueError("precompute_board requires exactly 5 cards")
+    codes = [CARD_CODES[card] for card in board]
+    primes = tuple(CARD_PRIMES[card] for card in board)
+    product = 1
+    for prime in primes:
+        product *= prime
+
+    # Two hole cards can only complete a flush in a suit with three board cards
+    flush_bit = 0
+    flush_count = 0
+    for suit_bit in SUIT_BITS:
+        count = sum(1 for code in codes if code & suit_bit)
+        if count >= 3:
+            flush_bit = suit_bit
+            flush_count = count
+    return BoardState(
+        tuple(board), primes, product, _cards_mask(board), flush_bit, flush_count
+    )
+
+
+def evaluate_with_board(hole_cards: Sequence[Card], board: BoardState) -> EvaluatedHand:
+    """
+    Evaluate the best hand from two hole cards and a precomputed board.
+
+    Equivalent to evaluate_best_hand(hole_cards + board cards), but the board
+    cards are not decoded again for every player.
+    """
+    if len(hole_cards) != 2:
+        raise ValueError("evaluate_with_board requires exactly 2 hole cards")
+    h0, h1 = hole_cards
+    code0 = CARD_CODES[h0]
+    code1 = CARD_CODES[h1]
+    p0 = CARD_PRIMES[h0]
+    p1 = CARD_PRIMES[h1]
+
+    flush_bit = board.flush_bit
+    if flush_bit:
+        suited = board.flush_count + (code0 & flush_bit != 0) + (code1 & flush_bit != 0)
+        if suited < 5:
+            flush_bit = 0
+
+    best_rank, best_mask = _best_of_seven(
+        (h0, h1) + board.cards,
+        (p0, p1) + board.primes,
+        p0 * p1 * board.product,
+        board.mask | (1 << h0) | (1 << h1),
+        flush_bit,
+    )
+    category, tiebreakers = _HAND_CLASSES[best_rank]
+    return EvaluatedHand(category, tiebreakers, best_mask)
 
 
 def compare_hands(a: EvaluatedHand, b: EvaluatedHand) -> int:
@@ -173,16 +480,95 @@ def compare_hands(a: EvaluatedHand, b: EvaluatedHand) -> int:
     return 0
 
 
+# Blind return (stake included) for a winning hand; Flush (3:2) and Royal Flush
+# are special-cased, and any other category pushes
+_BLIND_RETURNS = {
+    HandCategory.STRAIGHT: 2,  # 1:1
+    HandCategory.FULL_HOUSE: 4,  # 3:1
+    HandCategory.FOUR_OF_A_KIND: 11,  # 10:1
+    HandCategory.STRAIGHT_FLUSH: 51,  # 50:1
+}
+
+
+def settle_bets(
+    player_best: EvaluatedHand,
+    dealer_best: EvaluatedHand,
+    ante: int,
+    blind: int,
+    play: int,
+) -> Tuple[int, int, int]:
+    """
+    Settle a player's ante, blind and play bets against the dealer.
+
+    Args:
+        player_best: The player's best hand
+        dealer_best: The dealer's best hand
+        ante: Ante stake
+        blind: Blind stake
+        play: Play (bet) stake
+
+    Returns:
+        Amounts returned for the ante, blind and play bets, stakes included
+    """
+    result = compare_hands(player_best, dealer_best)
+    dealer_qualifies = dealer_best.category >= HandCategory.PAIR
+
+    ante_return = 0
+    blind_return = 0
+    play_return = 0
+
+    # Play (bet) pays even money; push on tie
+    if play > 0:
+        if result > 0:
+            play_return = play * 2
+        elif result == 0:
+            play_return = play
+
+    # Ante pays 1:1 only if dealer qualifies; otherwise push regardless
+    if ante > 0:
+        if dealer_qualifies:
+            if result > 0:
+                ante_return = ante * 2
+            elif result == 0:
+                ante_return = ante
+        else:
+            ante_return = ante
+
+    # Blind payout table; push if win with less than a Straight; push on tie; lose on dealer win
+    if blind > 0:
+        if result > 0:
+            category = player_best.category
+            if category == HandCategory.FLUSH:
+                # 3:2 payout → stake + 1.5x
+                blind_return = blind + (blind * 3) // 2
+            elif (
+                category == HandCategory.STRAIGHT_FLUSH
+                and player_best.tiebreakers[0] == 14
+            ):
+                blind_return = blind * 501  # Royal Flush 500:1
+            else:
+                blind_return = blind * _BLIND_RETURNS.get(category, 1)
+        elif result == 0:
+            blind_return = blind
+
+    return ante_return, blind_return, play_return
+
+
+# Display names indexed by HandCategory value
+_HAND_CATEGORY_NAMES = (
+    "High Card",
+    "Pair",
+    "Two Pair",
+    "Three of a Kind",
+    "Straight",
+    "Flush",
+    "Full House",
+    "Four of a Kind",
+    "Straight Flush",
+)
+
+
 def hand_category_to_string(category: HandCategory) -> str:
-    mapping = {
-        HandCategory.HIGH_CARD: "High Card",
-        HandCategory.PAIR: "Pair",
-        HandCategory.TWO_PAIR: "Two Pair",
-        HandCategory.THREE_OF_A_KIND: "Three of a Kind",
-        HandCategory.STRAIGHT: "Straight",
-        HandCategory.FLUSH: "Flush",
-        HandCategory.FULL_HOUSE: "Full House",
-        HandCategory.FOUR_OF_A_KIND: "Four of a Kind",
-        HandCategory.STRAIGHT_FLUSH: "Straight Flush",
-    }
-    return mapping.get(category, str(category))
+    if 0 <= category < len(_HAND_CATEGORY_NAMES):
+        return _HAND_CATEGORY_NAMES[category]
+    return str(category)
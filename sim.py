@@ -0,0 +1,76 @@
+from typing import List, Optional
+
+from deck import Deck, card_rank
+from players import PREFLOP_BET, STREET_MULTIPLIERS, Street
+from rules import evaluate_with_board, precompute_board, settle_bets
+
+
+def run_hands(
+    n_hands: int,
+    bankrolls: List[int],
+    ante: int = 1,
+    blind: int = 1,
+    base_bet: int = 1,
+    deck: Optional[Deck] = None,
+    seed: Optional[int] = None,
+) -> List[int]:
+    """
+    Play hands of the simple AI strategy on plain ints, without Game objects.
+
+    Produces the same results as Game.play_hand with console output off: the
+    same deal order from the deck, the same betting decisions and the same
+    payouts, but with no per-player state objects or game-state bookkeeping.
+
+    Args:
+        n_hands: Number of hands to play
+        bankrolls: Starting money for each seat (not modified)
+        ante: Ante each seat posts per hand
+        blind: Blind each seat posts per hand
+        base_bet: Base play bet, multiplied by the street multiplier
+        deck: Deck to deal from, or None for a new one seeded with seed
+        seed: Seed for the new deck, or None for a random one
+
+    Returns:
+        Each seat's net win or loss over the hands
+    """
+    if deck is None:
+        deck = Deck(seed)
+    money = list(bankrolls)
+    preflop_bet = base_bet * STREET_MULTIPLIERS[Street.PRE_FLOP]
+    seats = range(len(money))
+
+    for _ in range(n_hands):
+        deck.reset()
+        deck.shuffle()
+
+        # A seat that cannot cover both the ante and the blind sits the hand out
+        active = []
+        for seat in seats:
+            if money[seat] >= ante + blind:
+                money[seat] -= ante + blind
+                active.append(seat)
+
+        cards = deck.deal_cards(2 * len(active) + 2)
+        board = precompute_board(deck.deal_cards(5))
+        dealer_best = evaluate_with_board(cards[-2:], board)
+
+        for i, seat in enumerate(active):
+            hole = cards[2 * i : 2 * i + 2]
+
+            # Bet pre-flop when the table says so and it is affordable;
+            # otherwise check through and lose the blind and ante at the river
+            play = 0
+            if PREFLOP_BET[card_rank(hole[0])][card_rank(hole[1])] and (
+                money[seat] >= preflop_bet
+            ):
+                play = preflop_bet
+                money[seat] -= play
+            else:
+                money[seat] -= blind + ante
+
+            ante_return, blind_return, play_return = settle_bets(
+                evaluate_with_board(hole, board), dealer_best, ante, blind, play
+            )
+            money[seat] += ante_return + blind_return + play_return
+
+    return [m - b for m, b in zip(money, bankrolls)]
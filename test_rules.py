@@ -0,0 +1,164 @@
+import random
+import unittest
+from itertools import combinations
+from typing import List, Sequence, Tuple
+
+from deck import Card, card_rank, card_suit
+from rules import (
+    _HAND_CLASSES,
+    HandCategory,
+    evaluate_best_7,
+    evaluate_best_hand,
+    evaluate_hands_batch,
+    evaluate_with_board,
+    precompute_board,
+)
+
+
+def card(rank: int, suit: int) -> Card:
+    """Build a card from its rank (1=Ace to 13=King) and suit code."""
+    return suit * 13 + rank - 1
+
+
+def reference_five(cards: Sequence[Card]) -> Tuple[HandCategory, Tuple[int, ...]]:
+    """Classify five cards the slow, obvious way, with aces counted as 14."""
+    values = sorted(
+        (card_rank(c) if card_rank(c) > 1 else 14 for c in cards), reverse=True
+    )
+    flush = len({card_suit(c) for c in cards}) == 1
+    straight_high = None
+    if len(set(values)) == 5:
+        if values[0] - values[4] == 4:
+            straight_high = values[0]
+        elif values == [14, 5, 4, 3, 2]:
+            straight_high = 5
+
+    # Ranks ordered by how often they appear, then by value
+    groups = sorted(((values.count(v), v) for v in set(values)), reverse=True)
+    counts = [count for count, _ in groups]
+    by_count = tuple(value for _, value in groups)
+
+    if flush and straight_high:
+        return HandCategory.STRAIGHT_FLUSH, (straight_high,)
+    if counts[0] == 4:
+        return HandCategory.FOUR_OF_A_KIND, by_count
+    if counts[:2] == [3, 2]:
+        return HandCategory.FULL_HOUSE, by_count
+    if flush:
+        return HandCategory.FLUSH, tuple(values)
+    if straight_high:
+        return HandCategory.STRAIGHT, (straight_high,)
+    if counts[0] == 3:
+        return HandCategory.THREE_OF_A_KIND, by_count
+    if counts[:2] == [2, 2]:
+        return HandCategory.TWO_PAIR, by_count
+    if counts[0] == 2:
+        return HandCategory.PAIR, by_count
+    return HandCategory.HIGH_CARD, tuple(values)
+
+
+def reference_best(cards: Sequence[Card]) -> Tuple[HandCategory, Tuple[int, ...]]:
+    """Best reference classification of any five of the cards."""
+    return max(reference_five(hand) for hand in combinations(cards, 5))
+
+
+def flush_heavy_hand(rng: random.Random) -> List[Card]:
+    """Seven cards with at least five of one suit, to exercise flush paths."""
+    suit = rng.randrange(4)
+    suited = [card(rank, suit) for rank in range(1, 14)]
+    others = [c for c in range(52) if card_suit(c) != suit]
+    hand = rng.sample(suited, rng.randrange(5, 8))
+    return hand + rng.sample(others, 7 - len(hand))
+
+
+class EvaluatorTest(unittest.TestCase):
+    """The table-driven evaluator must agree with a plain reference ranking."""
+
+    def assert_hand(
+        self,
+        cards: Sequence[Card],
+        category: HandCategory,
+        tiebreakers: Tuple[int, ...],
+    ) -> None:
+        hand = evaluate_best_hand(cards)
+        self.assertEqual((hand.category, hand.tiebreakers), (category, tiebreakers))
+
+    def test_known_hands(self) -> None:
+        royal = [card(rank, 3) for rank in (1, 13, 12, 11, 10)]
+        self.assert_hand(royal, HandCategory.STRAIGHT_FLUSH, (14,))
+
+        wheel = [card(1, 0), card(2, 1), card(3, 2), card(4, 3), card(5, 0)]
+        self.assert_hand(wheel, HandCategory.STRAIGHT, (5,))
+
+        steel_wheel = [card(rank, 2) for rank in (1, 2, 3, 4, 5)]
+        self.assert_hand(steel_wheel, HandCategory.STRAIGHT_FLUSH, (5,))
+
+        # Hearts 2, 5, 7, 8, 9 make a flush; the 6 of spades adds a 5-9 straight
+        flush_and_straight = [card(r, 0) for r in (2, 5, 7, 8, 9)] + [
+            card(6, 3),
+            card(13, 1),
+        ]
+        self.assert_hand(flush_and_straight, HandCategory.FLUSH, (9, 8, 7, 5, 2))
+
+        quads = [card(9, suit) for suit in range(4)] + [
+            card(13, 0),
+            card(13, 1),
+            card(3, 2),
+        ]
+        self.assert_hand(quads, HandCategory.FOUR_OF_A_KIND, (9, 13))
+
+    def test_rank_table_size(self) -> None:
+        # Index 0 is unused; ranks run from 1 (royal flush) to 7462
+        self.assertEqual(len(_HAND_CLASSES), 7463)
+
+    def test_matches_reference(self) -> None:
+        rng = random.Random(1)
+        hands = [rng.sample(range(52), n) for n in (5, 6, 7) for _ in range(1000)]
+        hands += [flush_heavy_hand(rng) for _ in range(1000)]
+        for cards in hands:
+            with self.subTest(cards=cards):
+                hand = evaluate_best_hand(cards)
+                expected = reference_best(cards)
+                self.assertEqual((hand.category, hand.tiebreakers), expected)
+                # The reported cards must be five of the input making that hand
+                self.assertEqual(len(hand.cards), 5)
+                self.assertTrue(set(hand.cards) <= set(cards))
+                self.assertEqual(reference_five(hand.cards), expected)
+
+    def test_board_matches_best_hand(self) -> None:
+        rng = random.Random(2)
+        hands = [rng.sample(range(52), 7) for _ in range(1000)]
+        hands += [flush_heavy_hand(rng) for _ in range(1000)]
+        for cards in hands:
+            rng.shuffle(cards)
+            hole, board = cards[:2], cards[2:]
+            with self.subTest(hole=hole, board=board):
+                self.assertEqual(
+                    evaluate_with_board(hole, precompute_board(board)),
+                    evaluate_best_hand(hole + board),
+                )
+
+    def test_rank_matches_best_hand(self) -> None:
+        rng = random.Random(3)
+        hands = [rng.sample(range(52), 7) for _ in range(500)]
+        hands += [flush_heavy_hand(rng) for _ in range(500)]
+        ranks = evaluate_hands_batch(hands)
+        for cards, rank in zip(hands, ranks):
+            hand = evaluate_best_hand(cards)
+            self.assertEqual(evaluate_best_7(cards), rank)
+            self.assertEqual(_HAND_CLASSES[rank], (hand.category, hand.tiebreakers))
+
+    def test_wrong_card_counts(self) -> None:
+        for n in (5, 6, 8):
+            with self.subTest(n=n), self.assertRaises(ValueError):
+                evaluate_best_7(list(range(n)))
+        with self.assertRaises(ValueError):
+            evaluate_best_hand(list(range(4)))
+        with self.assertRaises(ValueError):
+            precompute_board(list(range(4)))
+        with self.assertRaises(ValueError):
+            evaluate_with_board([0], precompute_board(list(range(1, 6))))
+
+
+if __name__ == "__main__":
+    unittest.main()
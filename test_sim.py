@@ -0,0 +1,72 @@
+import unittest
+
+from deck import Deck
+from game import Game
+from sim import run_hands
+
+
+class RunHandsTest(unittest.TestCase):
+    """run_hands must play exactly the hands Game.simulate_batch plays."""
+
+    def assert_matches_game(self, num_players: int, money: int, seed: int) -> None:
+        game = Game(num_players=num_players, verbose=False, seed=seed)
+        for player in game.players:
+            player.money = money
+        expected = game.simulate_batch(300).net
+
+        net = run_hands(300, [money] * num_players, deck=Deck(seed))
+        self.assertEqual(net, expected)
+
+    def test_matches_game(self) -> None:
+        for num_players in (1, 3, 6):
+            for seed in (1, 2, 3):
+                with self.subTest(num_players=num_players, seed=seed):
+                    self.assert_matches_game(num_players, 1_000_000, seed)
+
+    def test_matches_game_with_low_bankrolls(self) -> None:
+        # Seats run out of money for the play bet, then the ante and blind
+        for num_players in (1, 3, 6):
+            for money in (0, 1, 2, 3, 5, 6, 20):
+                with self.subTest(num_players=num_players, money=money):
+                    self.assert_matches_game(num_players, money, seed=money)
+
+    def test_seed_repeats(self) -> None:
+        bankrolls = [1_000_000] * 4
+        self.assertEqual(
+            run_hands(200, bankrolls, seed=9), run_hands(200, bankrolls, seed=9)
+        )
+
+
+class PlayParallelTest(unittest.TestCase):
+    """Quiet games must respect bankrolls and repeat for any worker count."""
+
+    def test_low_bankrolls_play_serially(self) -> None:
+        with Game(
+            num_players=2, iterations=2000, verbose=False, seed=1, workers=4
+        ) as game:
+            for player in game.players:
+                player.money = 10
+            game.start_game()
+
+        serial = Game(num_players=2, verbose=False, seed=1)
+        for player in serial.players:
+            player.money = 10
+        serial.simulate_batch(2000)
+
+        money = [player.money for player in game.players]
+        self.assertEqual(money, [player.money for player in serial.players])
+        self.assertTrue(all(m >= 0 for m in money))
+
+    def test_seeded_results_ignore_worker_count(self) -> None:
+        results = []
+        for workers in (1, 3):
+            with Game(
+                num_players=3, iterations=2500, verbose=False, seed=7, workers=workers
+            ) as game:
+                game.start_game()
+            results.append([player.money for player in game.players])
+        self.assertEqual(results[0], results[1])
+
+
+if __name__ == "__main__":
+    unittest.main()